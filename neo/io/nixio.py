@@ -22,8 +22,8 @@ Neo: https://github.com/G-Node/python-neo/wiki
 
 from datetime import date, time, datetime
 from collections.abc import Iterable
-from collections import OrderedDict
-import itertools
+from collections import defaultdict
+from functools import lru_cache
 from uuid import uuid4
 import warnings
 from distutils.version import LooseVersion as Version
@@ -46,6 +46,9 @@ except ImportError:
 
 
 datetime_types = (date, time, datetime)
+# NumPy types whose tolist() values get the same NIX data type as the NumPy
+# scalars themselves; other arrays are passed on element by element
+_tolist_types = (np.bool_, np.int64, np.float64)
 
 EMPTYANNOTATION = "EMPTYLIST"
 ARRAYANNOTATION = "ARRAYANNOTATION"
@@ -67,16 +70,44 @@ def stringify(value):
     return str(value)
 
 
-def create_quantity(values, unitstr):
+@lru_cache(maxsize=512)
+def _parse_unit(unitstr):
     if "*" in unitstr:
-        unit = pq.CompoundUnit(stringify(unitstr))
-    else:
-        unit = unitstr
-    return pq.Quantity(values, unit)
+        return pq.CompoundUnit(stringify(unitstr))
+    return unitstr
+
+
+def _array_to_values(arr):
+    """
+    Converts a 1D array to a sequence of property values. Arrays of the types
+    in _tolist_types are converted in one go, all others are split into their
+    NumPy scalars so the NIX data type of the property is preserved.
+    """
+    if arr.dtype.type in _tolist_types:
+        return arr.tolist()
+    return tuple(arr)
+
+
+def create_quantity(values, unitstr):
+    return pq.Quantity(values, _parse_unit(unitstr), copy=False)
+
+
+@lru_cache(maxsize=128)
+def _datetime_from_timestamp(timestamp):
+    # Segments of a Block usually share their creation time, so the
+    # (immutable) datetime objects are reused
+    return datetime.fromtimestamp(timestamp)
 
 
 def units_to_string(pqunit):
-    dim = str(pqunit.dimensionality)
+    return _dimensionality_to_string(pqunit.dimensionality)
+
+
+@lru_cache(maxsize=256)
+def _dimensionality_to_string(dimensionality):
+    # a file typically uses only a handful of distinct units, so the
+    # formatted strings are cached per (hashable) Dimensionality
+    dim = str(dimensionality)
     if dim.startswith("(") and dim.endswith(")"):
         return dim.strip("()")
     return dim
@@ -99,6 +130,16 @@ def dt_to_nix(dt):
     return dt
 
 
+def _calculate_timestamp(dt):
+    """
+    Converts a datetime or date object to an integer POSIX timestamp, as used
+    for the creation time of NIX objects. Dates are taken at midnight.
+    """
+    if not isinstance(dt, datetime):
+        dt = datetime.combine(dt, time())
+    return int(dt.timestamp())
+
+
 def dt_from_nix(nixdt, annotype):
     """
     Inverse function of 'dt_to_nix()'. Requires the stored annotation type to
@@ -164,11 +205,28 @@ class NixIO(BaseIO):
     extensions = ["h5", "nix"]
     mode = "file"
 
-    def __init__(self, filename, mode="rw"):
+    # NIX DataArray type -> (conversion method, Segment container) for signals
+    _signal_readers = {
+        "neo.analogsignal": ("_nix_to_neo_analogsignal", "analogsignals"),
+        "neo.irregularlysampledsignal": ("_nix_to_neo_irregularlysampledsignal",
+                                         "irregularlysampledsignals"),
+        "neo.imagesequence": ("_nix_to_neo_imagesequence", "imagesequences"),
+    }
+
+    def __init__(self, filename, mode="rw", compression=None):
         """
         Initialise IO instance and NIX file.
 
         :param filename: Full path to the file
+        :param mode: File mode: 'ro' (ReadOnly), 'rw' (ReadWrite),
+        or 'ow' (Overwrite)
+        :param compression: Compression used for the data written to the file,
+        given as a ``nixio.Compression`` value. Defaults to
+        ``nixio.Compression.DeflateNormal``. Use ``nixio.Compression.No`` to
+        write uncompressed data, which is faster to write and read but takes
+        more disk space. The
+        option only applies to data written through this IO, i.e. to files
+        opened in 'rw' or 'ow' mode; it has no effect in 'ro' mode.
         """
         check_nix_version()
         BaseIO.__init__(self, filename)
@@ -183,7 +241,9 @@ class NixIO(BaseIO):
             raise ValueError(f"Invalid mode specified '{mode}'. "
                              "Valid modes: 'ro' (ReadOnly)', 'rw' (ReadWrite),"
                              " 'ow' (Overwrite).")
-        self.nix_file = nix.File.open(self.filename, filemode)
+        if compression is None:
+            compression = nix.Compression.DeflateNormal
+        self.nix_file = nix.File.open(self.filename, filemode, compression=compression)
 
         if self.nix_file.mode == nix.FileMode.ReadOnly:
             self._file_version = '0.5.2'
@@ -203,11 +263,20 @@ class NixIO(BaseIO):
             self._file_version = neover
 
         self._block_read_counter = 0
+        # Neo name -> NIX Block, built on the first read by Neo name
+        self._block_neo_names = None
 
         # helper maps
         self._neo_map = dict()
-        self._ref_map = dict()
+        self._ref_map = defaultdict(list)
         self._signal_map = dict()
+        self._source_map = dict()
+        self._mtag_map = dict()
+        self._group_signal_map = dict()
+
+        # generated object names (see _generate_nix_name)
+        self._nix_name_prefix = uuid4().hex[:16]
+        self._nix_name_counter = 0
 
         # _names_ok is used to guard against name check duplication
         self._names_ok = False
@@ -221,8 +290,7 @@ class NixIO(BaseIO):
     def read_all_blocks(self, lazy=False):
         if lazy:
             raise Exception("Lazy loading is not supported for NixIO")
-        return list(self._nix_to_neo_block(blk)
-                    for blk in self.nix_file.blocks)
+        return [self._nix_to_neo_block(blk) for blk in self.nix_file.blocks]
 
     def read_block(self, index=None, nixname=None, neoname=None, lazy=False):
         """
@@ -259,13 +327,16 @@ class NixIO(BaseIO):
         elif nixname is not None:
             nix_block = self.nix_file.blocks[nixname]
         elif neoname is not None:
-            for blk in self.nix_file.blocks:
-                if ("neo_name" in blk.metadata
-                        and blk.metadata["neo_name"] == neoname):
-                    nix_block = blk
-                    break
-            else:
+            if self._block_neo_names is None:
+                self._block_neo_names = dict()
+                for blk in self.nix_file.blocks:
+                    blkmd = blk.metadata
+                    if "neo_name" in blkmd:
+                        # first Block wins for non-unique Neo names
+                        self._block_neo_names.setdefault(blkmd["neo_name"], blk)
+            if neoname not in self._block_neo_names:
                 raise KeyError(f"Block with Neo name '{neoname}' does not exist")
+            nix_block = self._block_neo_names[neoname]
         else:
             index = self._block_read_counter
             if index >= len(self.nix_file.blocks):
@@ -286,7 +357,7 @@ class NixIO(BaseIO):
     def _nix_to_neo_block(self, nix_block):
         neo_attrs = self._nix_attr_to_neo(nix_block)
         neo_block = Block(**neo_attrs)
-        neo_block.rec_datetime = datetime.fromtimestamp(nix_block.created_at)
+        neo_block.rec_datetime = _datetime_from_timestamp(nix_block.created_at)
 
         # descend into Groups
         for grp in nix_block.groups:
@@ -299,12 +370,9 @@ class NixIO(BaseIO):
         blockdas = self._group_signals(nix_block.data_arrays)
         for name, das in blockdas.items():
             if name not in self._neo_map:
-                if das[0].type == "neo.analogsignal":
-                    self._nix_to_neo_analogsignal(das)
-                elif das[0].type == "neo.irregularlysampledsignal":
-                    self._nix_to_neo_irregularlysampledsignal(das)
-                elif das[0].type == "neo.imagesequence":
-                    self._nix_to_neo_imagesequence(das)
+                reader = self._signal_readers.get(das[0].type)
+                if reader is not None:
+                    getattr(self, reader[0])(das)
         for mt in nix_block.multi_tags:
             if mt.type == "neo.spiketrain" and mt.name not in self._neo_map:
                 self._nix_to_neo_spiketrain(mt)
@@ -321,7 +389,7 @@ class NixIO(BaseIO):
 
         # reset maps
         self._neo_map = dict()
-        self._ref_map = dict()
+        self._ref_map = defaultdict(list)
         self._signal_map = dict()
 
         return neo_block
@@ -329,35 +397,22 @@ class NixIO(BaseIO):
     def _nix_to_neo_segment(self, nix_group):
         neo_attrs = self._nix_attr_to_neo(nix_group)
         neo_segment = Segment(**neo_attrs)
-        neo_segment.rec_datetime = datetime.fromtimestamp(nix_group.created_at)
+        neo_segment.rec_datetime = _datetime_from_timestamp(nix_group.created_at)
         self._neo_map[nix_group.name] = neo_segment
 
         # this will probably get all the DAs anyway, but if we change any part
         # of the mapping to add other kinds of DataArrays to a group, such as
         # MultiTag positions and extents, this filter will be necessary
-        dataarrays = list(filter(
-            lambda da: da.type in ("neo.analogsignal",
-                                   "neo.irregularlysampledsignal",
-                                   "neo.imagesequence",),
-            nix_group.data_arrays))
+        dataarrays = [da for da in nix_group.data_arrays
+                      if da.type in self._signal_readers]
         dataarrays = self._group_signals(dataarrays)
         # descend into DataArrays
         for name, das in dataarrays.items():
-            if das[0].type == "neo.analogsignal":
-                newasig = self._nix_to_neo_analogsignal(das)
-                neo_segment.analogsignals.append(newasig)
-                # parent reference
-                newasig.segment = neo_segment
-            elif das[0].type == "neo.irregularlysampledsignal":
-                newisig = self._nix_to_neo_irregularlysampledsignal(das)
-                neo_segment.irregularlysampledsignals.append(newisig)
-                # parent reference
-                newisig.segment = neo_segment
-            elif das[0].type == "neo.imagesequence":
-                new_imgseq = self._nix_to_neo_imagesequence(das)
-                neo_segment.imagesequences.append(new_imgseq)
-                # parent reference
-                new_imgseq.segment = neo_segment
+            readername, container = self._signal_readers[das[0].type]
+            newsig = getattr(self, readername)(das)
+            getattr(neo_segment, container).append(newsig)
+            # parent reference
+            newsig.segment = neo_segment
 
         # descend into MultiTags
         for mtag in nix_group.multi_tags:
@@ -381,19 +436,37 @@ class NixIO(BaseIO):
 
     def _nix_to_neo_channelindex(self, nix_source):
         neo_attrs = self._nix_attr_to_neo(nix_source)
-        channels = list(self._nix_attr_to_neo(c) for c in nix_source.sources
-                        if c.type == "neo.channelindex")
-        neo_attrs["index"] = np.array([c["index"] for c in channels])
-        if len(channels):
-            chan_names = list(c["name"] for c in channels
-                              if "name" in c and c["name"] is not None)
-            chan_ids = list(c["channel_id"] for c in channels if "channel_id" in c)
-            if chan_names:
-                neo_attrs["channel_names"] = chan_names
-            if chan_ids:
-                neo_attrs["channel_ids"] = chan_ids
-            if "coordinates" in channels[0]:
-                neo_attrs["coordinates"] = list(c["coordinates"] for c in channels)
+        # collect channel attributes and Unit sources in a single pass
+        index = []
+        chan_names = []
+        chan_ids = []
+        coordinates = []
+        unitsources = []
+        for src in nix_source.sources:
+            if src.type == "neo.channelindex":
+                chan = self._nix_attr_to_neo(src)
+                index.append(chan["index"])
+                if chan.get("name") is not None:
+                    chan_names.append(chan["name"])
+                if "channel_id" in chan:
+                    chan_ids.append(chan["channel_id"])
+                if "coordinates" in chan:
+                    coordinates.append(chan["coordinates"])
+            elif src.type == "neo.unit":
+                unitsources.append(src)
+        neo_attrs["index"] = np.fromiter(index, dtype=int, count=len(index))
+        if chan_names:
+            neo_attrs["channel_names"] = chan_names
+        if chan_ids:
+            neo_attrs["channel_ids"] = chan_ids
+        if coordinates:
+            firstcoord = coordinates[0]
+            if all(c.shape == firstcoord.shape and c.dimensionality == firstcoord.dimensionality
+                   for c in coordinates):
+                # homogeneous coordinates: build a single 2D Quantity
+                coordinates = pq.Quantity(np.vstack([c.magnitude for c in coordinates]),
+                                          firstcoord.units, copy=False)
+            neo_attrs["coordinates"] = coordinates
 
         neo_chx = ChannelIndex(**neo_attrs)
         self._neo_map[nix_source.name] = neo_chx
@@ -408,12 +481,11 @@ class NixIO(BaseIO):
                 # else error?
 
         # descend into Sources
-        for src in nix_source.sources:
-            if src.type == "neo.unit":
-                newunit = self._nix_to_neo_unit(src)
-                neo_chx.units.append(newunit)
-                # parent reference
-                newunit.channel_index = neo_chx
+        for src in unitsources:
+            newunit = self._nix_to_neo_unit(src)
+            neo_chx.units.append(newunit)
+            # parent reference
+            newunit.channel_index = neo_chx
 
         return neo_chx
 
@@ -440,7 +512,7 @@ class NixIO(BaseIO):
         neo_attrs["nix_name"] = metadata.name  # use the common base name
 
         unit = nix_da_group[0].unit
-        signaldata = np.array([d[:] for d in nix_da_group]).transpose()
+        signaldata = self._stack_dataarrays(nix_da_group)
         signaldata = create_quantity(signaldata, unit)
         timedim = self._get_time_dimension(nix_da_group[0])
         sampling_period = create_quantity(timedim.sampling_interval, timedim.unit)
@@ -459,11 +531,8 @@ class NixIO(BaseIO):
                                   t_start=t_start, **neo_attrs)
         self._neo_map[neo_attrs["nix_name"]] = neo_signal
         # all DAs reference the same sources
-        srcnames = list(src.name for src in nix_da_group[0].sources)
-        for n in srcnames:
-            if n not in self._ref_map:
-                self._ref_map[n] = list()
-            self._ref_map[n].append(neo_signal)
+        for src in nix_da_group[0].sources:
+            self._ref_map[src.name].append(neo_signal)
         return neo_signal
 
     def _nix_to_neo_imagesequence(self, nix_da_group):
@@ -480,7 +549,7 @@ class NixIO(BaseIO):
         metadata = nix_da_group[0].metadata
         neo_attrs["nix_name"] = metadata.name  # use the common base name
         unit = nix_da_group[0].unit
-        imgseq = np.array([d[:] for d in nix_da_group]).transpose()
+        imgseq = self._stack_dataarrays(nix_da_group)
 
         sampling_rate = neo_attrs["sampling_rate"]
         del neo_attrs["sampling_rate"]
@@ -498,11 +567,8 @@ class NixIO(BaseIO):
 
         self._neo_map[neo_attrs["nix_name"]] = neo_seq
         # all DAs reference the same sources
-        srcnames = list(src.name for src in nix_da_group[0].sources)
-        for n in srcnames:
-            if n not in self._ref_map:
-                self._ref_map[n] = list()
-            self._ref_map[n].append(neo_seq)
+        for src in nix_da_group[0].sources:
+            self._ref_map[src.name].append(neo_seq)
         return neo_seq
 
     def _nix_to_neo_irregularlysampledsignal(self, nix_da_group):
@@ -519,7 +585,7 @@ class NixIO(BaseIO):
         neo_attrs["nix_name"] = metadata.name  # use the common base name
 
         unit = nix_da_group[0].unit
-        signaldata = np.array([d[:] for d in nix_da_group]).transpose()
+        signaldata = self._stack_dataarrays(nix_da_group)
         signaldata = create_quantity(signaldata, unit)
         timedim = self._get_time_dimension(nix_da_group[0])
         times = create_quantity(timedim.ticks, timedim.unit)
@@ -527,11 +593,8 @@ class NixIO(BaseIO):
         neo_signal = IrregularlySampledSignal(signal=signaldata, times=times, **neo_attrs)
         self._neo_map[neo_attrs["nix_name"]] = neo_signal
         # all DAs reference the same sources
-        srcnames = list(src.name for src in nix_da_group[0].sources)
-        for n in srcnames:
-            if n not in self._ref_map:
-                self._ref_map[n] = list()
-            self._ref_map[n].append(neo_signal)
+        for src in nix_da_group[0].sources:
+            self._ref_map[src.name].append(neo_signal)
         return neo_signal
 
     def _nix_to_neo_event(self, nix_mtag):
@@ -570,17 +633,17 @@ class NixIO(BaseIO):
             interval_units = wftime.unit
             neo_spiketrain.sampling_period = create_quantity(wftime.sampling_interval,
                                                              interval_units)
-            left_sweep_units = wftime.unit
             if "left_sweep" in wfda.metadata:
+                # left_sweep is written with its own units; older files may
+                # lack them, in which case the waveform time units apply
+                left_sweep_prop = wfda.metadata.props["left_sweep"]
+                left_sweep_units = left_sweep_prop.unit or wftime.unit
                 neo_spiketrain.left_sweep = create_quantity(wfda.metadata["left_sweep"],
                                                             left_sweep_units)
         self._neo_map[nix_mtag.name] = neo_spiketrain
 
-        srcnames = list(src.name for src in nix_mtag.sources)
-        for n in srcnames:
-            if n not in self._ref_map:
-                self._ref_map[n] = list()
-            self._ref_map[n].append(neo_spiketrain)
+        for src in nix_mtag.sources:
+            self._ref_map[src.name].append(neo_spiketrain)
         return neo_spiketrain
 
     def write_all_blocks(self, neo_blocks, use_obj_names=False):
@@ -620,27 +683,31 @@ class NixIO(BaseIO):
             nix_name = f"neo.block.{self._generate_nix_name()}"
             block.annotate(nix_name=nix_name)
 
+        # Blocks are about to change: drop the Neo name lookup table
+        self._block_neo_names = None
         if nix_name in self.nix_file.blocks:
-            nixblock = self.nix_file.blocks[nix_name]
             del self.nix_file.blocks[nix_name]
             del self.nix_file.sections[nix_name]
 
+        # Sources and MultiTags are only linked within the Block being written
+        self._source_map = dict()
+        self._mtag_map = dict()
+        self._group_signal_map = dict()
+
         nixblock = self.nix_file.create_block(nix_name, "neo.block")
-        nixblock.metadata = self.nix_file.create_section(nix_name, "neo.block.metadata")
-        metadata = nixblock.metadata
+        metadata = self.nix_file.create_section(nix_name, "neo.block.metadata")
+        nixblock.metadata = metadata
         neoname = block.name if block.name is not None else ""
         metadata["neo_name"] = neoname
         nixblock.definition = block.description
         if block.rec_datetime:
-            nix_rec_dt = int(block.rec_datetime.strftime("%s"))
+            nix_rec_dt = _calculate_timestamp(block.rec_datetime)
             nixblock.force_created_at(nix_rec_dt)
         if block.file_datetime:
             fdt, annotype = dt_to_nix(block.file_datetime)
             fdtprop = metadata.create_property("file_datetime", fdt)
             fdtprop.definition = annotype
-        if block.annotations:
-            for k, v in block.annotations.items():
-                self._write_property(metadata, k, v)
+        self._write_annotations(metadata, block.annotations)
 
         # descend into Segments
         for seg in block.segments:
@@ -667,29 +734,31 @@ class NixIO(BaseIO):
             nix_name = f"neo.channelindex.{self._generate_nix_name()}"
             chx.annotate(nix_name=nix_name)
         nixsource = nixblock.create_source(nix_name, "neo.channelindex")
-        nixsource.metadata = nixblock.metadata.create_section(nix_name,
-                                                              "neo.channelindex.metadata")
-
-        metadata = nixsource.metadata
+        self._source_map[nix_name] = nixsource
+        metadata = nixblock.metadata.create_section(nix_name, "neo.channelindex.metadata")
+        nixsource.metadata = metadata
         neoname = chx.name if chx.name is not None else ""
         metadata["neo_name"] = neoname
         nixsource.definition = chx.description
-        if chx.annotations:
-            for k, v in chx.annotations.items():
-                self._write_property(metadata, k, v)
+        self._write_annotations(metadata, chx.annotations)
 
         coordinates = chx.coordinates
-        if coordinates is not None and np.ndim(coordinates) == 1:
+        coordunits = None
+        if isinstance(coordinates, pq.Quantity):
+            # coordinates of all channels share their units: convert the
+            # whole array in one step (1D for single channel ChannelIndex)
+            coordunits = stringify(coordinates.dimensionality)
+            coordinates = np.atleast_2d(coordinates.magnitude).tolist()
+        elif coordinates is not None and np.ndim(coordinates) == 1:
             # support 1D coordinates for single ChannelIndex
             coordinates = [coordinates]
 
         for idx, channel in enumerate(chx.index):
             channame = f"{nix_name}.ChannelIndex{idx}"
             nixchan = nixsource.create_source(channame, "neo.channelindex")
-            nixchan.metadata = nixsource.metadata.create_section(nixchan.name,
-                                                                 "neo.channelindex.metadata")
-            nixchan.definition = nixsource.definition
-            chanmd = nixchan.metadata
+            chanmd = metadata.create_section(channame, "neo.channelindex.metadata")
+            nixchan.metadata = chanmd
+            nixchan.definition = chx.description
             chanmd["index"] = int(channel)
             if len(chx.channel_names):
                 neochanname = stringify(chx.channel_names[idx])
@@ -699,10 +768,14 @@ class NixIO(BaseIO):
                 chanmd["channel_id"] = chanid
             if coordinates is not None:
                 coords = coordinates[idx]
-                coordunits = stringify(coords[0].dimensionality)
-                nixcoords = tuple(c.magnitude.item() for c in coords)
-                chanprop = chanmd.create_property("coordinates", nixcoords)
-                chanprop.unit = coordunits
+                if coordunits is None:
+                    chanprop = chanmd.create_property(
+                        "coordinates", tuple(c.magnitude.item() for c in coords)
+                    )
+                    chanprop.unit = stringify(coords[0].dimensionality)
+                else:
+                    chanprop = chanmd.create_property("coordinates", tuple(coords))
+                    chanprop.unit = coordunits
 
         # Descend into Units
         for unit in chx.units:
@@ -723,22 +796,19 @@ class NixIO(BaseIO):
             segment.annotate(nix_name=nix_name)
 
         nixgroup = nixblock.create_group(nix_name, "neo.segment")
-        nixgroup.metadata = nixblock.metadata.create_section(nix_name,
-                                                             "neo.segment.metadata")
-        metadata = nixgroup.metadata
+        metadata = nixblock.metadata.create_section(nix_name, "neo.segment.metadata")
+        nixgroup.metadata = metadata
         neoname = segment.name if segment.name is not None else ""
         metadata["neo_name"] = neoname
         nixgroup.definition = segment.description
         if segment.rec_datetime:
-            nix_rec_dt = int(segment.rec_datetime.strftime("%s"))
+            nix_rec_dt = _calculate_timestamp(segment.rec_datetime)
             nixgroup.force_created_at(nix_rec_dt)
         if segment.file_datetime:
             fdt, annotype = dt_to_nix(segment.file_datetime)
             fdtprop = metadata.create_property("file_datetime", fdt)
             fdtprop.definition = annotype
-        if segment.annotations:
-            for k, v in segment.annotations.items():
-                self._write_property(metadata, k, v)
+        self._write_annotations(metadata, segment.annotations)
 
         # write signals, events, epochs, and spiketrains
         for asig in segment.analogsignals:
@@ -775,39 +845,34 @@ class NixIO(BaseIO):
         if f"{nix_name}.0" in nixblock.data_arrays and nixgroup:
             # AnalogSignal is in multiple Segments.
             # Append DataArrays to Group and return.
-            dalist = list()
-            for idx in itertools.count():
-                daname = f"{nix_name}.{idx}"
-                if daname in nixblock.data_arrays:
-                    dalist.append(nixblock.data_arrays[daname])
-                else:
-                    break
-            nixgroup.data_arrays.extend(dalist)
+            nixgroup.data_arrays.extend(self._signal_map[nix_name])
             return
 
         if isinstance(anasig, BaseProxy):
-            data = np.transpose(anasig.load()[:].magnitude)
+            data = np.transpose(anasig.load().magnitude)
         else:
-            data = np.transpose(anasig[:].magnitude)
+            data = np.transpose(anasig.magnitude)
 
         parentmd = nixgroup.metadata if nixgroup else nixblock.metadata
         metadata = parentmd.create_section(nix_name, "neo.analogsignal.metadata")
+        # values shared by the DataArrays of all channels
+        sigunits = units_to_string(anasig.units)
+        sampling_period = anasig.sampling_period.magnitude.item()
+        spunits = units_to_string(anasig.sampling_period.units)
+        tstart = anasig.t_start
+        metadata["t_start"] = tstart.magnitude.item()
+        metadata.props["t_start"].unit = units_to_string(tstart.units)
+        offset = tstart.rescale(spunits).magnitude.item()
         nixdas = list()
         for idx, row in enumerate(data):
             daname = f"{nix_name}.{idx}"
             da = nixblock.create_data_array(daname, "neo.analogsignal", data=row)
             da.metadata = metadata
             da.definition = anasig.description
-            da.unit = units_to_string(anasig.units)
+            da.unit = sigunits
 
-            sampling_period = anasig.sampling_period.magnitude.item()
-            timedim = da.append_sampled_dimension(sampling_period)
-            timedim.unit = units_to_string(anasig.sampling_period.units)
-            tstart = anasig.t_start
-            metadata["t_start"] = tstart.magnitude.item()
-            metadata.props["t_start"].unit = units_to_string(tstart.units)
-            timedim.offset = tstart.rescale(timedim.unit).magnitude.item()
-            timedim.label = "time"
+            self._append_time_dimension(da, spunits, sampling_interval=sampling_period,
+                                        offset=offset)
 
             nixdas.append(da)
             if nixgroup:
@@ -815,13 +880,9 @@ class NixIO(BaseIO):
 
         neoname = anasig.name if anasig.name is not None else ""
         metadata["neo_name"] = neoname
-        if anasig.annotations:
-            for k, v in anasig.annotations.items():
-                self._write_property(metadata, k, v)
-        if anasig.array_annotations:
-            for k, v in anasig.array_annotations.items():
-                p = self._write_property(metadata, k, v)
-                p.definition = ARRAYANNOTATION
+        self._write_annotations(metadata, anasig.annotations)
+        self._write_annotations(metadata, anasig.array_annotations,
+                                definition=ARRAYANNOTATION)
 
         self._signal_map[nix_name] = nixdas
 
@@ -844,25 +905,30 @@ class NixIO(BaseIO):
             imgseq.annotate(nix_name=nix_name)
 
         if f"{nix_name}.0" in nixblock.data_arrays and nixgroup:
-
-            dalist = list()
-            for idx in itertools.count():
-                daname = f"{nix_name}.{idx}"
-                if daname in nixblock.data_arrays:
-                    dalist.append(nixblock.data_arrays[daname])
-                else:
-                    break
-            nixgroup.data_arrays.extend(dalist)
+            # ImageSequence is in multiple Segments.
+            # Append DataArrays to Group and return.
+            nixgroup.data_arrays.extend(self._signal_map[nix_name])
             return
 
         if isinstance(imgseq, BaseProxy):
-            data = np.transpose(imgseq.load()[:].magnitude)
+            data = np.transpose(imgseq.load().magnitude)
         else:
-            data = np.transpose(imgseq[:].magnitude)
+            data = np.transpose(imgseq.magnitude)
 
         parentmd = nixgroup.metadata if nixgroup else nixblock.metadata
         metadata = parentmd.create_section(nix_name, "neo.imagesequence.metadata")
 
+        metadata["sampling_rate"] = imgseq.sampling_rate.magnitude.item()
+        units = imgseq.sampling_rate.units
+        metadata.props["sampling_rate"].unit = units_to_string(units)
+        metadata["spatial_scale"] = imgseq.spatial_scale.magnitude.item()
+        units = imgseq.spatial_scale.units
+        metadata.props["spatial_scale"].unit = units_to_string(units)
+        metadata["t_start"] = imgseq.t_start.magnitude.item()
+        units = imgseq.t_start.units
+        metadata.props["t_start"].unit = units_to_string(units)
+
+        sequnits = units_to_string(imgseq.units)
         nixdas = list()
         for idx, row in enumerate(data):
             daname = f"{nix_name}.{idx}"
@@ -870,17 +936,7 @@ class NixIO(BaseIO):
 
             da.metadata = metadata
             da.definition = imgseq.description
-            da.unit = units_to_string(imgseq.units)
-
-            metadata["sampling_rate"] = imgseq.sampling_rate.magnitude.item()
-            units = imgseq.sampling_rate.units
-            metadata.props["sampling_rate"].unit = units_to_string(units)
-            metadata["spatial_scale"] = imgseq.spatial_scale.magnitude.item()
-            units = imgseq.spatial_scale.units
-            metadata.props["spatial_scale"].unit = units_to_string(units)
-            metadata["t_start"] = imgseq.t_start.magnitude.item()
-            units = imgseq.t_start.units
-            metadata.props["t_start"].unit = units_to_string(units)
+            da.unit = sequnits
 
             nixdas.append(da)
             if nixgroup:
@@ -888,9 +944,7 @@ class NixIO(BaseIO):
 
         neoname = imgseq.name if imgseq.name is not None else ""
         metadata["neo_name"] = neoname
-        if imgseq.annotations:
-            for k, v in imgseq.annotations.items():
-                self._write_property(metadata, k, v)
+        self._write_annotations(metadata, imgseq.annotations)
         self._signal_map[nix_name] = nixdas
 
     def _write_irregularlysampledsignal(self, irsig, nixblock, nixgroup):
@@ -913,34 +967,29 @@ class NixIO(BaseIO):
         if f"{nix_name}.0" in nixblock.data_arrays and nixgroup:
             # IrregularlySampledSignal is in multiple Segments.
             # Append DataArrays to Group and return.
-            dalist = list()
-            for idx in itertools.count():
-                daname = f"{nix_name}.{idx}"
-                if daname in nixblock.data_arrays:
-                    dalist.append(nixblock.data_arrays[daname])
-                else:
-                    break
-            nixgroup.data_arrays.extend(dalist)
+            nixgroup.data_arrays.extend(self._signal_map[nix_name])
             return
 
         if isinstance(irsig, BaseProxy):
-            data = np.transpose(irsig.load()[:].magnitude)
+            data = np.transpose(irsig.load().magnitude)
         else:
-            data = np.transpose(irsig[:].magnitude)
+            data = np.transpose(irsig.magnitude)
 
         parentmd = nixgroup.metadata if nixgroup else nixblock.metadata
         metadata = parentmd.create_section(nix_name, "neo.irregularlysampledsignal.metadata")
+        # values shared by the DataArrays of all channels
+        sigunits = units_to_string(irsig.units)
+        times = irsig.times.magnitude
+        timeunits = units_to_string(irsig.times.units)
         nixdas = list()
         for idx, row in enumerate(data):
             daname = f"{nix_name}.{idx}"
             da = nixblock.create_data_array(daname, "neo.irregularlysampledsignal", data=row)
             da.metadata = metadata
             da.definition = irsig.description
-            da.unit = units_to_string(irsig.units)
+            da.unit = sigunits
 
-            timedim = da.append_range_dimension(irsig.times.magnitude)
-            timedim.unit = units_to_string(irsig.times.units)
-            timedim.label = "time"
+            self._append_time_dimension(da, timeunits, ticks=times)
 
             nixdas.append(da)
             if nixgroup:
@@ -948,13 +997,9 @@ class NixIO(BaseIO):
 
         neoname = irsig.name if irsig.name is not None else ""
         metadata["neo_name"] = neoname
-        if irsig.annotations:
-            for k, v in irsig.annotations.items():
-                self._write_property(metadata, k, v)
-        if irsig.array_annotations:
-            for k, v in irsig.array_annotations.items():
-                p = self._write_property(metadata, k, v)
-                p.definition = ARRAYANNOTATION
+        self._write_annotations(metadata, irsig.annotations)
+        self._write_annotations(metadata, irsig.array_annotations,
+                                definition=ARRAYANNOTATION)
 
         self._signal_map[nix_name] = nixdas
 
@@ -989,8 +1034,8 @@ class NixIO(BaseIO):
         timesda.unit = units
         nixmt = nixblock.create_multi_tag(nix_name, "neo.event", positions=timesda)
 
-        nixmt.metadata = nixgroup.metadata.create_section(nix_name, "neo.event.metadata")
-        metadata = nixmt.metadata
+        metadata = nixgroup.metadata.create_section(nix_name, "neo.event.metadata")
+        nixmt.metadata = metadata
 
         labeldim = timesda.append_set_dimension()
         labeldim.labels = labels
@@ -998,20 +1043,13 @@ class NixIO(BaseIO):
         neoname = event.name if event.name is not None else ""
         metadata["neo_name"] = neoname
         nixmt.definition = event.description
-        if event.annotations:
-            for k, v in event.annotations.items():
-                self._write_property(metadata, k, v)
-        if event.array_annotations:
-            for k, v in event.array_annotations.items():
-                p = self._write_property(metadata, k, v)
-                p.definition = ARRAYANNOTATION
+        self._write_annotations(metadata, event.annotations)
+        self._write_annotations(metadata, event.array_annotations,
+                                definition=ARRAYANNOTATION)
 
         nixgroup.multi_tags.append(nixmt)
 
-        # reference all AnalogSignals and IrregularlySampledSignals in Group
-        for da in nixgroup.data_arrays:
-            if da.type in ("neo.analogsignal", "neo.irregularlysampledsignal"):
-                nixmt.references.append(da)
+        self._reference_group_signals(nixmt, nixgroup)
 
     def _write_epoch(self, epoch, nixblock, nixgroup):
         """
@@ -1050,8 +1088,8 @@ class NixIO(BaseIO):
         durada.unit = dunits
         nixmt.extents = durada
 
-        nixmt.metadata = nixgroup.metadata.create_section(nix_name, "neo.epoch.metadata")
-        metadata = nixmt.metadata
+        metadata = nixgroup.metadata.create_section(nix_name, "neo.epoch.metadata")
+        nixmt.metadata = metadata
 
         labeldim = timesda.append_set_dimension()
         labeldim.labels = epoch.labels
@@ -1059,20 +1097,33 @@ class NixIO(BaseIO):
         neoname = epoch.name if epoch.name is not None else ""
         metadata["neo_name"] = neoname
         nixmt.definition = epoch.description
-        if epoch.annotations:
-            for k, v in epoch.annotations.items():
-                self._write_property(metadata, k, v)
-        if epoch.array_annotations:
-            for k, v in epoch.array_annotations.items():
-                p = self._write_property(metadata, k, v)
-                p.definition = ARRAYANNOTATION
+        self._write_annotations(metadata, epoch.annotations)
+        self._write_annotations(metadata, epoch.array_annotations,
+                                definition=ARRAYANNOTATION)
 
         nixgroup.multi_tags.append(nixmt)
 
-        # reference all AnalogSignals and IrregularlySampledSignals in Group
-        for da in nixgroup.data_arrays:
-            if da.type in ("neo.analogsignal", "neo.irregularlysampledsignal"):
-                nixmt.references.append(da)
+        self._reference_group_signals(nixmt, nixgroup)
+
+    def _reference_group_signals(self, nixmt, nixgroup):
+        """
+        Adds all AnalogSignal and IrregularlySampledSignal DataArrays in the
+        NIX Group to the references of the MultiTag.
+
+        The signal DataArrays of a Group are collected once and reused for
+        every Event and Epoch of the Segment, since all signals of a Segment
+        are written before its Events and Epochs.
+
+        :param nixmt: NIX MultiTag (Event or Epoch) that references the signals
+        :param nixgroup: NIX Group (Segment) containing the signals
+        """
+        signals = self._group_signal_map.get(nixgroup.name)
+        if signals is None:
+            reftypes = ("neo.analogsignal", "neo.irregularlysampledsignal")
+            signals = [da for da in nixgroup.data_arrays if da.type in reftypes]
+            self._group_signal_map[nixgroup.name] = signals
+        for da in signals:
+            nixmt.references.append(da)
 
     def _write_spiketrain(self, spiketrain, nixblock, nixgroup):
         """
@@ -1089,10 +1140,9 @@ class NixIO(BaseIO):
             nix_name = f"neo.spiketrain.{self._generate_nix_name()}"
             spiketrain.annotate(nix_name=nix_name)
 
-        if nix_name in nixblock.multi_tags and nixgroup:
+        if nixgroup and nix_name in self._mtag_map:
             # SpikeTrain is in multiple Segments. Append to Group and return.
-            mt = nixblock.multi_tags[nix_name]
-            nixgroup.multi_tags.append(mt)
+            nixgroup.multi_tags.append(self._mtag_map[nix_name])
             return
 
         if isinstance(spiketrain, BaseProxy):
@@ -1106,10 +1156,11 @@ class NixIO(BaseIO):
                                              data=times)
         timesda.unit = tunits
         nixmt = nixblock.create_multi_tag(nix_name, "neo.spiketrain", positions=timesda)
+        self._mtag_map[nix_name] = nixmt
 
         parentmd = nixgroup.metadata if nixgroup else nixblock.metadata
-        nixmt.metadata = parentmd.create_section(nix_name, "neo.spiketrain.metadata")
-        metadata = nixmt.metadata
+        metadata = parentmd.create_section(nix_name, "neo.spiketrain.metadata")
+        nixmt.metadata = metadata
 
         neoname = spiketrain.name if spiketrain.name is not None else ""
         metadata["neo_name"] = neoname
@@ -1118,36 +1169,32 @@ class NixIO(BaseIO):
         self._write_property(metadata, "t_start", spiketrain.t_start)
         self._write_property(metadata, "t_stop", spiketrain.t_stop)
 
-        if spiketrain.annotations:
-            for k, v in spiketrain.annotations.items():
-                self._write_property(metadata, k, v)
-        if spiketrain.array_annotations:
-            for k, v in spiketrain.array_annotations.items():
-                p = self._write_property(metadata, k, v)
-                p.definition = ARRAYANNOTATION
+        self._write_annotations(metadata, spiketrain.annotations)
+        self._write_annotations(metadata, spiketrain.array_annotations,
+                                definition=ARRAYANNOTATION)
 
         if nixgroup:
             nixgroup.multi_tags.append(nixmt)
 
         if waveforms is not None:
-            wfdata = list(wf.magnitude for wf in
-                          list(wfgroup for wfgroup in spiketrain.waveforms))
-            wfunits = units_to_string(spiketrain.waveforms.units)
+            wfunits = units_to_string(waveforms.units)
             wfda = nixblock.create_data_array(f"{nix_name}.waveforms", "neo.waveforms",
-                                              data=wfdata)
+                                              data=waveforms.magnitude)
             wfda.unit = wfunits
-            wfda.metadata = nixmt.metadata.create_section(wfda.name, "neo.waveforms.metadata")
+            wfmd = metadata.create_section(f"{nix_name}.waveforms", "neo.waveforms.metadata")
+            wfda.metadata = wfmd
             nixmt.create_feature(wfda, nix.LinkType.Indexed)
             # TODO: Move time dimension first for PR #457
             # https://github.com/NeuralEnsemble/python-neo/pull/457
             wfda.append_set_dimension()
             wfda.append_set_dimension()
-            wftime = wfda.append_sampled_dimension(spiketrain.sampling_period.magnitude.item())
-            wftime.unit = units_to_string(spiketrain.sampling_period.units)
-            wftime.label = "time"
+            self._append_time_dimension(
+                wfda, units_to_string(spiketrain.sampling_period.units),
+                sampling_interval=spiketrain.sampling_period.magnitude.item()
+            )
 
             if spiketrain.left_sweep is not None:
-                self._write_property(wfda.metadata, "left_sweep", spiketrain.left_sweep)
+                self._write_property(wfmd, "left_sweep", spiketrain.left_sweep)
 
     def _write_unit(self, neounit, nixchxsource):
         """
@@ -1164,15 +1211,14 @@ class NixIO(BaseIO):
             nix_name = f"neo.unit.{self._generate_nix_name()}"
             neounit.annotate(nix_name=nix_name)
         nixunitsource = nixchxsource.create_source(nix_name, "neo.unit")
-        nixunitsource.metadata = nixchxsource.metadata.create_section(nix_name,
-                                                                      "neo.unit.metadata")
-        metadata = nixunitsource.metadata
+        # Unit names are only unique within their ChannelIndex
+        self._source_map[(nixchxsource.name, nix_name)] = nixunitsource
+        metadata = nixchxsource.metadata.create_section(nix_name, "neo.unit.metadata")
+        nixunitsource.metadata = metadata
         neoname = neounit.name if neounit.name is not None else ""
         metadata["neo_name"] = neoname
         nixunitsource.definition = neounit.description
-        if neounit.annotations:
-            for k, v in neounit.annotations.items():
-                self._write_property(metadata, k, v)
+        self._write_annotations(metadata, neounit.annotations)
 
     def _create_source_links(self, neoblock, nixblock):
         """
@@ -1210,25 +1256,42 @@ class NixIO(BaseIO):
                         and isig.annotations["nix_name"] in self._signal_map):
                     self._write_irregularlysampledsignal(isig, nixblock, None)
                 signames.append(isig.annotations["nix_name"])
-            chxsource = nixblock.sources[chx.annotations["nix_name"]]
+            chxname = chx.annotations["nix_name"]
+            chxsource = self._source_map[chxname]
             for name in signames:
                 for da in self._signal_map[name]:
                     da.sources.append(chxsource)
 
             for unit in chx.units:
-                unitsource = chxsource.sources[unit.annotations["nix_name"]]
+                unitsource = self._source_map[(chxname, unit.annotations["nix_name"])]
                 for st in unit.spiketrains:
-                    mtags = nixblock.multi_tags
                     if not ("nix_name" in st.annotations
-                            and st.annotations["nix_name"] in mtags):
+                            and st.annotations["nix_name"] in self._mtag_map):
                         self._write_spiketrain(st, nixblock, None)
-                    stmt = mtags[st.annotations["nix_name"]]
+                    stmt = self._mtag_map[st.annotations["nix_name"]]
                     stmt.sources.append(chxsource)
                     stmt.sources.append(unitsource)
 
-    @staticmethod
-    def _generate_nix_name():
-        return uuid4().hex
+    def _generate_nix_name(self):
+        # random prefix per IO instance + counter: unique names without
+        # drawing random bytes for every object
+        name = f"{self._nix_name_prefix}{self._nix_name_counter:016x}"
+        self._nix_name_counter += 1
+        return name
+
+    def _write_annotations(self, section, annotations, definition=None):
+        """
+        Write all items of an annotation dictionary as metadata properties on
+        the provided metadata section.
+
+        :param section: The metadata section to hold the new properties
+        :param annotations: The annotation dictionary to write
+        :param definition: If set, the definition of each new property
+        """
+        for k, v in annotations.items():
+            prop = self._write_property(section, k, v)
+            if definition is not None and prop is not None:
+                prop.definition = definition
 
     def _write_property(self, section, name, v):
         """
@@ -1243,7 +1306,7 @@ class NixIO(BaseIO):
 
         if isinstance(v, pq.Quantity):
             if len(v.shape):
-                section.create_property(name, tuple(v.magnitude))
+                section.create_property(name, _array_to_values(v.magnitude))
             else:
                 section.create_property(name, v.magnitude.item())
             section.props[name].unit = str(v.dimensionality)
@@ -1258,6 +1321,8 @@ class NixIO(BaseIO):
                 section.create_property(name, nix.DataType.String)
         elif isinstance(v, bytes):
             section.create_property(name, v.decode())
+        elif isinstance(v, np.ndarray) and v.ndim == 0:
+            section.create_property(name, v.item())
         elif isinstance(v, Iterable):
             values = []
             unit = None
@@ -1268,10 +1333,10 @@ class NixIO(BaseIO):
                 # iterable as opposed to empty string
                 values = nix.DataType.String
                 definition = EMPTYANNOTATION
-            elif hasattr(v, "ndim") and v.ndim == 0:
-                values = v.item()
-                if isinstance(v, pq.Quantity):
-                    unit = str(v.dimensionality)
+            elif isinstance(v, np.ndarray) and v.ndim == 1 and v.dtype.type in _tolist_types:
+                # these arrays hold no strings, quantities or nested
+                # containers, so convert them in one go
+                values = v.tolist()
             else:
                 for item in v:
                     if isinstance(item, str):
@@ -1350,20 +1415,67 @@ class NixIO(BaseIO):
         :return: A dictionary mapping a base name to a list of DataArrays which
         belong to the same Signal
         """
-        # now start grouping
-        groups = OrderedDict()
+        # groups keep the order in which their first DataArray was seen
+        groups = defaultdict(list)
         for da in dataarrays:
-            basename = ".".join(da.name.split(".")[:-1])
-            if basename not in groups:
-                groups[basename] = list()
-            groups[basename].append(da)
+            groups[da.name.rpartition(".")[0]].append(da)
 
         return groups
 
+    @staticmethod
+    def _stack_dataarrays(nix_da_group):
+        """
+        Reads the data of a group of DataArrays, which all have the same shape,
+        into a single preallocated array. The result is the transpose of the
+        stacked DataArray data, i.e., for 1D DataArrays each DataArray becomes
+        one column of the returned 2D array.
+
+        The array is allocated with the type of the data as read, not as
+        stored, since DataArrays with polynomial coefficients or an expansion
+        origin are read back as calibrated floating point values.
+
+        :param nix_da_group: a list of NIX DataArray objects
+        :return: a numpy array
+        """
+        first = nix_da_group[0][:]
+        data = np.empty((len(nix_da_group),) + first.shape, dtype=first.dtype)
+        data[0] = first
+        for idx, da in enumerate(nix_da_group[1:], start=1):
+            values = da[:]
+            if not np.can_cast(values.dtype, data.dtype):
+                data = data.astype(np.result_type(data.dtype, values.dtype))
+            data[idx] = values
+        return data.transpose()
+
+    @staticmethod
+    def _append_time_dimension(da, unit, sampling_interval=None, ticks=None, offset=None):
+        """
+        Append a time dimension to a DataArray: a SampledDimension if a
+        sampling interval is given, otherwise a RangeDimension with the given
+        ticks. The unit, the offset (SampledDimension only) and the "time"
+        label of the new dimension are set as well.
+
+        :param da: The DataArray to append the dimension to
+        :param unit: The time unit string
+        :param sampling_interval: The sampling interval for a SampledDimension
+        :param ticks: The ticks for a RangeDimension
+        :param offset: The offset of a SampledDimension
+        :return: The new dimension
+        """
+        if sampling_interval is not None:
+            timedim = da.append_sampled_dimension(sampling_interval)
+            if offset is not None:
+                timedim.offset = offset
+        else:
+            timedim = da.append_range_dimension(ticks)
+        timedim.unit = unit
+        timedim.label = "time"
+        return timedim
+
     @staticmethod
     def _get_time_dimension(obj):
         for dim in obj.dimensions:
-            if hasattr(dim, "label") and dim.label == "time":
+            if getattr(dim, "label", None) == "time":
                 return dim
         return None
 
@@ -1372,7 +1484,7 @@ class NixIO(BaseIO):
         allobjs = []
 
         def check_unique(objs):
-            names = list(o.name for o in objs)
+            names = [o.name for o in objs]
             if None in names or "" in names:
                 raise ValueError(names)
             if len(names) != len(set(names)):
@@ -1446,6 +1558,10 @@ class NixIO(BaseIO):
             self._neo_map = None
             self._ref_map = None
             self._signal_map = None
+            self._source_map = None
+            self._mtag_map = None
+            self._group_signal_map = None
+            self._block_neo_names = None
             self._block_read_counter = None
 
     def __del__(self):
@@ -38,6 +38,7 @@ from neo.io.proxyobjects import (AnalogSignalProxy, SpikeTrainProxy,
 
 try:
     import nixio as nix
+    import h5py
 
     HAVE_NIX = True
 except ImportError:
@@ -841,6 +842,32 @@ class NixIOWriteTest(NixIOTest):
         block.channel_indexes.append(newchx)
         self.write_and_compare([block])
 
+    def test_channel_index_coords_read(self):
+        block = Block(name=self.rword())
+        # homogeneous coordinates are read as a single (nchan, ndim) Quantity
+        chxn = ChannelIndex(name="homogeneous", index=[1, 2, 3])
+        chxn.coordinates = self.rquant((3, 2), pq.mm)
+        # coordinates with different units per channel are read as a list
+        chxh = ChannelIndex(name="heterogeneous", index=[0, 1])
+        chxh.coordinates = [pq.Quantity([1, 2], "mm"), pq.Quantity([3, 4], "um")]
+        block.channel_indexes.extend([chxn, chxh])
+        self.writer.write_block(block)
+
+        rblock = self.writer.read_block(neoname=block.name)
+        rchx = {chx.name: chx for chx in rblock.channel_indexes}
+        rchxn, rchxh = rchx["homogeneous"], rchx["heterogeneous"]
+        self.assertIsInstance(rchxn.coordinates, pq.Quantity)
+        self.assertEqual(rchxn.coordinates.shape, (3, 2))
+        np.testing.assert_almost_equal(rchxn.coordinates.magnitude,
+                                       chxn.coordinates.magnitude)
+        self.assertEqual(rchxn.coordinates.units, pq.mm)
+
+        self.assertIsInstance(rchxh.coordinates, list)
+        self.assertEqual(len(rchxh.coordinates), 2)
+        for wcoord, rcoord in zip(chxh.coordinates, rchxh.coordinates):
+            self.assertEqual(rcoord.units, wcoord.units)
+            np.testing.assert_almost_equal(rcoord.magnitude, wcoord.magnitude)
+
     def test_signals_write(self):
         block = Block()
         seg = Segment()
@@ -1000,6 +1027,8 @@ class NixIOWriteTest(NixIOTest):
 
         spiketrain.left_sweep = pq.Quantity(-10, "ms")
         self.write_and_compare([block])
+        rst = self.writer.read_all_blocks()[0].segments[0].spiketrains[-1]
+        self.assertEqual(rst.left_sweep, pq.Quantity(-10, "ms"))
 
     def test_metadata_structure_write(self):
         neoblk = self.create_all_annotated()
@@ -1407,6 +1436,17 @@ class NixIOWriteTest(NixIOTest):
         self.compare_blocks([blk], scndreader.blocks)
         checksignalcounts(secondwrite)
 
+    def test_create_quantity(self):
+        # Quantity inputs are rescaled to the requested units
+        quant = create_quantity(1 * pq.s, "ms")
+        self.assertEqual(quant.units, pq.ms)
+        self.assertEqual(quant.magnitude, 1000)
+
+        values = np.arange(5, dtype=float)
+        quant = create_quantity(values, "mV*s")
+        np.testing.assert_equal(quant.magnitude, values)
+        self.assertEqual(quant.units, pq.CompoundUnit("mV*s"))
+
     def test_to_value(self):
         section = self.io.nix_file.create_section("Metadata value test",
                                                   "Test")
@@ -1442,11 +1482,34 @@ class NixIOWriteTest(NixIOTest):
         writeprop(section, "randarray", randarray)
         np.testing.assert_almost_equal(randarray, section["randarray"])
 
+        # arrays and quantity arrays keep the NIX data type of their element
+        # type, whether they are converted with tolist() or item by item
+        for dtype in (np.bool_, np.float64, np.float32, np.int64, np.int32, np.uint16):
+            arr = np.arange(5).astype(dtype)
+            values = [arr]
+            if dtype is not np.bool_:
+                values.append(pq.Quantity(arr, "mV"))
+            for value in values:
+                isquant = isinstance(value, pq.Quantity)
+                name = "{}arr-{}".format("q" if isquant else "", np.dtype(dtype).name)
+                writeprop(section, name, value)
+                section.create_property(name + "-items", list(arr))
+                self.assertEqual(section.props[name].data_type,
+                                 section.props[name + "-items"].data_type)
+                np.testing.assert_equal(section[name], arr)
+                if isquant:
+                    self.assertEqual(section.props[name].unit, "mV")
+
         # numpy item
         npval = np.float64(2398)
         writeprop(section, "npval", npval)
         self.assertEqual(npval, section["npval"])
 
+        # zero-dimensional array
+        nparr0d = np.array(4.5)
+        writeprop(section, "nparr0d", nparr0d)
+        self.assertEqual(nparr0d.item(), section["nparr0d"])
+
         # number
         val = 42
         writeprop(section, "val", val)
@@ -1768,6 +1831,42 @@ class NixIOContextTests(NixIOTest):
         self.assertEqual(blocks[0].annotations["nix_name"], name_one)
         self.assertEqual(blocks[1].annotations["nix_name"], name_two)
 
+    def test_context_write_uncompressed(self):
+        neoblock = Block(name=self.rword())
+        neoseg = Segment(name=self.rword())
+        neoblock.segments.append(neoseg)
+        neoseg.analogsignals.append(AnalogSignal(self.rquant((20, 3), pq.mV),
+                                                 sampling_rate=pq.Quantity(10, "Hz")))
+
+        def data_compression(filename):
+            # compression filters of the data of all DataArrays in the file
+            filters = []
+
+            def visit(name, obj):
+                if (isinstance(obj, h5py.Dataset) and "/data_arrays/" in name
+                        and name.endswith("/data")):
+                    filters.append(obj.compression)
+
+            with h5py.File(filename, "r") as h5file:
+                h5file.visititems(visit)
+            return filters
+
+        with NixIO(self.filename, "ow") as iofile:
+            iofile.write_block(neoblock)
+        filters = data_compression(self.filename)
+        self.assertEqual(len(filters), 3)
+        self.assertTrue(all(f == "gzip" for f in filters))
+
+        with NixIO(self.filename, "ow", compression=nix.Compression.No) as iofile:
+            iofile.write_block(neoblock)
+        filters = data_compression(self.filename)
+        self.assertEqual(len(filters), 3)
+        self.assertTrue(all(f is None for f in filters))
+
+        nixfile = nix.File.open(self.filename, nix.FileMode.ReadOnly)
+        self.compare_blocks([neoblock], nixfile.blocks)
+        nixfile.close()
+
 
 @unittest.skipUnless(HAVE_NIX, "Requires NIX")
 class NixIOVerTests(NixIOTest):